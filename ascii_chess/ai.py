@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import shutil
 from dataclasses import dataclass
 from typing import Optional
@@ -14,6 +15,7 @@ except ImportError:
 DEFAULT_MIN_RATING = 1350
 DEFAULT_MAX_RATING = 2850
 DEFAULT_TIME = 0.5
+DEFAULT_HASH_MB = 256
 
 
 # ===== 엔진 설정 =====
@@ -23,6 +25,8 @@ class EngineConfig:
     min_rating: int = DEFAULT_MIN_RATING
     max_rating: int = DEFAULT_MAX_RATING
     default_think_time: float = DEFAULT_TIME
+    threads: Optional[int] = None
+    hash_mb: int = DEFAULT_HASH_MB
 
 
 # ===== 스톡피시 AI =====
@@ -34,6 +38,8 @@ class StockfishAI:
 
         self.config = config or EngineConfig()
         self._engine = self._launch_engine(self.config.executable_path)
+        self._game = object()
+        self._configure_resources()
         self._rating = max(self.config.min_rating, min(1500, self.config.max_rating))
         self.set_rating(self._rating)
 
@@ -45,6 +51,21 @@ class StockfishAI:
             )
         return chess.engine.SimpleEngine.popen_uci(candidate)
 
+    def _configure_resources(self) -> None:
+        # Half the cores by default, leaving the rest for the GUI and the OS.
+        threads = self.config.threads or max(1, (os.cpu_count() or 2) // 2)
+        options = {}
+        if "Threads" in self._engine.options:
+            options["Threads"] = threads
+        if "Hash" in self._engine.options:
+            options["Hash"] = self.config.hash_mb
+        if not options:
+            return
+        try:
+            self._engine.configure(options)
+        except chess.engine.EngineError as exc:
+            raise RuntimeError(f"Failed to configure Stockfish: {exc}") from exc
+
     @property
     def rating(self) -> int:
         return self._rating
@@ -64,7 +85,7 @@ class StockfishAI:
         if chess is None:
             raise RuntimeError("python-chess is required for Stockfish integration.")
         limit = chess.engine.Limit(time=think_time or self.config.default_think_time)
-        result = self._engine.play(board, limit=limit)
+        result = self._engine.play(board, limit=limit, game=self._game)
         return result.move
 
     def get_hint(self, board: "chess.Board", think_time: Optional[float] = None) -> tuple["chess.Move", str]:
@@ -77,12 +98,20 @@ class StockfishAI:
             })
             hint_time = (think_time or self.config.default_think_time) * 2
             limit = chess.engine.Limit(time=hint_time)
-            result = self._engine.play(board, limit=limit)
+            result = self._engine.play(board, limit=limit, game=self._game)
             san_move = board.san(result.move)
             return result.move, san_move
         finally:
             self.set_rating(original_rating)
 
+    def new_game(self) -> None:
+        if chess is None:
+            raise RuntimeError("python-chess is required for Stockfish integration.")
+        # A new game token makes python-chess send ucinewgame; a depth-1 search does it now
+        # so the first real move does not pay for the engine clearing its hash.
+        self._game = object()
+        self._engine.analyse(chess.Board(), chess.engine.Limit(depth=1), game=self._game)
+
     def close(self) -> None:
         try:
             self._engine.quit()
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import islice, zip_longest
 from pathlib import Path
+import random
+import re
+import time
 import tkinter as tk
 from tkinter import font as tkfont
-from tkinter import messagebox
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
 try:
     import chess
@@ -58,6 +64,33 @@ ENEMY_BASE_COLOR = "#888"
 ENEMY_HIGHLIGHT_COLOR = "#ffcc33"
 ENEMY_BLINK_INTERVAL_MS = 350
 ENEMY_BLINK_TOGGLES = 6
+AI_POLL_INTERVAL_MS = 20
+INTRO_BLINK_INTERVAL_MS = 500
+LABEL_FLUSH_MS = 16
+
+# Cheap syntactic filter before parse_san; accepts everything python-chess's SAN parser does.
+_SAN_RE = re.compile(
+    r"^(?:[O0]-[O0](?:-[O0])?|[NBKRQ]?[a-h]?[1-8]?[\-x]?[a-h][1-8](?:=?[nbrqkNBRQK])?)[+#]?$"
+)
+# Pawn, king and castling moves whose SAN never needs disambiguation, so the typed text
+# (minus the check suffix) is the canonical SAN once its capture marker matches the move.
+_PLAIN_SAN_RE = re.compile(r"[a-h](?:x[a-h])?[1-8](?:=[QRBN])?|Kx?[a-h][1-8]|O-O(?:-O)?")
+
+_PAWN_ART = """⠀⠀⠀⡀⠀⠄⠀⠀⢀⠀⠀⡀⠀⠠⠀⠀⠀⡀⠀⠄⠀⠀⠄⠀⠀⢀⠀⠠⠀⠀
+⠁⠀⠄⠀⠀⠄⠈⠀⡀⠀⠄⠀⠠⠀⠀⠁⡀⠀⠀⠄⠈⠀⡀⠈⢀⠀⠀⠠⠀⠁
+⠐⠀⠀⠐⠀⠀⠐⠀⠀⠄⠀⢐⡰⡜⡝⡵⣲⢔⠀⠀⠐⠀⠀⠄⠀⠀⠂⠀⠐⠀
+⠄⠀⠁⡀⠈⠀⠠⠈⠀⠀⠐⣸⢜⢜⢜⢎⡗⡯⣇⠁⢀⠀⠁⡀⠐⠀⡀⠁⠀⠄
+⠀⠀⠂⠀⠀⠂⠀⠄⠀⠁⢀⢺⡪⡮⣪⣳⢽⣝⡇⠄⠀⠠⠀⠀⠠⠀⠀⠠⠀⠠
+⠀⠂⠀⠈⢀⠀⠁⢀⠀⠁⠀⠀⡽⡽⣳⡽⣗⣏⠀⠀⠐⠀⠀⠂⠀⠀⠂⢀⠀⠂
+⠄⠀⠁⠠⠀⠀⠄⠀⠀⠄⠁⠙⠊⡯⣾⣺⡵⠋⠃⠁⢀⠈⠀⠠⠈⠀⡀⠀⠀⠄
+⠀⠐⠀⢀⠀⠂⠀⠐⠀⠀⠄⠀⠀⣟⢼⣞⣿⠀⠀⠂⠀⠀⠄⠀⠐⠀⠀⠐⠀⠀
+⠁⠀⠄⠀⢀⠀⠈⢀⠀⠁⠀⠈⢐⡽⣜⣞⣿⡀⠠⠀⠈⢀⠀⠈⢀⠀⠁⢀⠈⠀
+⠐⠀⠀⠐⠀⠀⠐⠀⠀⠄⠈⢀⢮⢯⢞⡾⡽⣧⡀⠀⠂⠀⠀⠐⠀⠀⠄⠀⠀⠂
+⡀⠀⠁⡀⠀⠁⡀⠐⠀⢀⠐⣨⢿⢽⡽⣾⣻⢷⡅⢀⠠⠀⠁⡀⠈⠀⡀⠈⢀⠀
+⠀⠀⠂⠀⠀⠂⠀⠠⠀⣖⡯⣺⢝⣗⢯⢗⡽⣳⢯⣗⡷⠀⠀⠀⠠⠀⠀⠠⠀⠀
+⠈⠀⡀⠈⠀⡀⠂⠀⠀⠺⠽⠽⣝⣞⡽⡽⣝⢷⠯⠷⠛⠀⠈⠀⡀⠀⠂⠀⠐⠀
+⠄⠀⠀⠄⠀⠀⠄⠈⠀⡀⠀⠄⠀⠀⢀⠀⠀⢀⠀⠠⠀⠈⠀⡀⠀⠠⠀⠁⠀⠄
+⢀⠀⠁⠀⠐⠀⠀⠐⠀⠀⠠⠀⠐⠀⠀⠀⠂⠀⠀⠄⠀⠂⠁⠀⠐⠀⠀⠐⠀⠀"""
 
 CELL_WIDTH = 3
 EDGE_LABEL_WIDTH = 2
@@ -94,6 +127,38 @@ FALLBACK_BOARD_THEME = DEFAULT_BOARD_THEMES[0]
 FALLBACK_PIECE_COLOR = DEFAULT_PIECE_COLORS[0]
 
 
+# ===== 칸 인덱스 테이블 =====
+# _SQUARE_CELLS[square] -> (board_text line, start column).
+# Plain square = rank * 8 + file arithmetic, so the table is built at import without python-chess.
+_SQUARE_CELLS = tuple(
+    (9 - (square >> 3), EDGE_LABEL_WIDTH + (square & 7) * CELL_WIDTH) for square in range(64)
+)
+
+
+def _square_tag_ranges() -> dict:
+    light: List[str] = []
+    dark: List[str] = []
+    for square, (line, col) in enumerate(_SQUARE_CELLS):
+        target = light if ((square >> 3) + (square & 7)) % 2 else dark
+        target.extend((f"{line}.{col}", f"{line}.{col + CELL_WIDTH}"))
+    return {"square_light": tuple(light), "square_dark": tuple(dark)}
+
+
+# tag name -> flat (start, end, start, end, ...) board_text indexes for a single tag_add call
+_SQUARE_TAG_RANGES = _square_tag_ranges()
+
+BOARD_HEADER = " " * EDGE_LABEL_WIDTH + "".join(
+    chr(ord("a") + file).center(CELL_WIDTH) for file in range(8)
+)
+RANK_LABELS = tuple(str(rank + 1).rjust(EDGE_LABEL_WIDTH) for rank in range(8))
+EMPTY_CELL = " " * CELL_WIDTH
+# Rank labels top rank first, in the order board_fen() lists the ranks.
+RANK_LABELS_TOP_DOWN = RANK_LABELS[::-1]
+BOARD_WIDTH_CHARS = EDGE_LABEL_WIDTH + 8 * CELL_WIDTH
+BOARD_HEIGHT_LINES = 9
+BOARD_TEXT_CACHE_SIZE = 512
+
+
 # ===== GUI 클래스 =====
 class ChessGUI:
     def __init__(self, root: tk.Tk, engine_config: EngineConfig, use_unicode: bool = True) -> None:
@@ -107,7 +172,17 @@ class ChessGUI:
         self.mode = "intro"
         self.engine_config = engine_config
         self.ai = StockfishAI(config=self.engine_config)
+        # Engine searches run here so the Tk mainloop keeps painting while Stockfish thinks.
+        self._executor = ThreadPoolExecutor(max_workers=1)
         self.use_unicode = use_unicode
+        symbol_map = UNICODE_PIECES if use_unicode else ASCII_PIECES
+        # Rendered cell per piece letter, indexed by ord(symbol).
+        self._cell_table = [EMPTY_CELL] * 128
+        for symbol in "PNBRQKpnbrqk":
+            self._cell_table[ord(symbol)] = symbol_map.get(symbol, symbol).center(CELL_WIDTH)
+        # str.translate table turning a board_fen() rank (piece letters, empty-run digits) into cells.
+        self._fen_rank_table = {ord(symbol): self._cell_table[ord(symbol)] for symbol in "PNBRQKpnbrqk"}
+        self._fen_rank_table.update({ord(str(run)): EMPTY_CELL * run for run in range(1, 9)})
         self.board = chess.Board()
         self.move_history: List[str] = []
         self.undo_stack: List[str] = [self.board.fen()]
@@ -117,10 +192,31 @@ class ChessGUI:
         self._forfeited = False
         self._enemy_highlight_square: Optional[int] = None
         self._enemy_blink_visible = True
-        self._enemy_blink_job: Optional[int] = None
+        self._next_enemy_blink: Optional[float] = None
+        self._next_intro_blink: Optional[float] = None
+        self._blink_tick_job: Optional[str] = None
         self._enemy_blink_remaining = 0
+        self._enemy_highlight_dirty = False
+        # Only the blink sets a non-base color, so tracking it there is enough to skip cget().
+        self._enemy_fg = ENEMY_BASE_COLOR
         self._is_rendering = False
+        self._last_render_key: Optional[tuple] = None
+        self._render_job: Optional[str] = None
+        self._batch_depth = 0
+        self._render_deferred = False
+        self._board_dirty = False
+        self._moves_dirty = False
+        self._pending_labels: dict = {}
+        self._label_job: Optional[str] = None
+        self._row_strings: List[str] = []
+        self._row_bitboards: Optional[tuple] = None
+        self._board_text_cache: OrderedDict = OrderedDict()
+        self._last_board_lines: List[str] = []
+        self._moves_rendered: Optional[int] = None
+        self._moves_formatted: List[str] = []
+        self._moves_formatted_count = 0
         self._ai_job: Optional[int] = None
+        self._ai_future: Optional[Future] = None
         self._focus_binding: Optional[str] = None
         self._closing = False
 
@@ -149,7 +245,6 @@ class ChessGUI:
         self.intro_options = ["Game Start", "Theme Settings"]
         self._intro_selection = 0
         self._intro_blink_state = True
-        self._intro_blink_job: Optional[int] = None
         self.intro_option_labels: List[tk.Label] = []
 
         self._ensure_menlo_font()
@@ -178,8 +273,8 @@ class ChessGUI:
 
         self.board_text = tk.Text(
             board_container,
-            width=34,
-            height=15,
+            width=BOARD_WIDTH_CHARS,
+            height=BOARD_HEIGHT_LINES,
             font=self.board_font,
             bg="#111",
             fg="#eee",
@@ -191,6 +286,7 @@ class ChessGUI:
             spacing3=10,
         )
         self.board_text.grid(row=0, column=0, sticky="nsew")
+        self.board_text.tag_configure("blink")
         board_container.rowconfigure(0, weight=1)
         board_container.columnconfigure(0, weight=1)
 
@@ -225,13 +321,14 @@ class ChessGUI:
         self.theme_listbox.bind("<<ListboxSelect>>", self._on_theme_selection_changed)
         self.theme_listbox.pack_forget()
 
+        self._theme_info_wrap = tkfont.Font(font=MOVE_FONT).measure("M" * LISTBOX_WIDTH)
         self.theme_info_label = tk.Label(
             moves_frame,
             text="",
             font=STATUS_FONT,
             fg="#999",
             justify=tk.LEFT,
-            wraplength=18 * tkfont.Font(font=MOVE_FONT).measure("M"),
+            wraplength=self._theme_info_wrap,
         )
         self.theme_info_label.pack_forget()
 
@@ -272,7 +369,7 @@ class ChessGUI:
 
         self.move_entry = tk.Entry(entry_row, font=PROMPT_FONT)
         self.move_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.move_entry.bind("<Return>", self._on_submit)
+        self.move_entry.bind("<Return>", self._dispatch_submit)
 
         help_label = tk.Label(
             input_frame,
@@ -313,6 +410,7 @@ class ChessGUI:
 
     # ===== 힌트 처리 =====
     def _get_hint(self) -> None:
+        self._flush_labels()
         if not self._hint_enabled or self.mode != "game":
             self.status_label.config(text="Hints can only be used during the game.")
             return
@@ -321,7 +419,7 @@ class ChessGUI:
             return
             
         try:
-            move, san_move = self.ai.get_hint(self.board)
+            move, san_move = self.ai.get_hint(self._board_snapshot())
             from_square = chess.square_name(move.from_square)
             to_square = chess.square_name(move.to_square)
             
@@ -352,10 +450,7 @@ class ChessGUI:
 
         for square in self._hint_squares:
             if 0 <= square < 64:
-                rank = chess.square_rank(square)
-                file = chess.square_file(square)
-                line = 9 - rank
-                col_start = EDGE_LABEL_WIDTH + file * CELL_WIDTH
+                line, col_start = _SQUARE_CELLS[square]
                 col_end = col_start + CELL_WIDTH
                 start_index = f"{line}.{col_start}"
                 end_index = f"{line}.{col_end}"
@@ -442,31 +537,14 @@ class ChessGUI:
         self.intro_frame = tk.Frame(self.root, bg="#111", padx=40, pady=40)
         self.intro_frame.pack(fill=tk.BOTH, expand=True)
 
-        pawn_art = (
-            """⠀⠀⠀⡀⠀⠄⠀⠀⢀⠀⠀⡀⠀⠠⠀⠀⠀⡀⠀⠄⠀⠀⠄⠀⠀⢀⠀⠠⠀⠀
-⠁⠀⠄⠀⠀⠄⠈⠀⡀⠀⠄⠀⠠⠀⠀⠁⡀⠀⠀⠄⠈⠀⡀⠈⢀⠀⠀⠠⠀⠁
-⠐⠀⠀⠐⠀⠀⠐⠀⠀⠄⠀⢐⡰⡜⡝⡵⣲⢔⠀⠀⠐⠀⠀⠄⠀⠀⠂⠀⠐⠀
-⠄⠀⠁⡀⠈⠀⠠⠈⠀⠀⠐⣸⢜⢜⢜⢎⡗⡯⣇⠁⢀⠀⠁⡀⠐⠀⡀⠁⠀⠄
-⠀⠀⠂⠀⠀⠂⠀⠄⠀⠁⢀⢺⡪⡮⣪⣳⢽⣝⡇⠄⠀⠠⠀⠀⠠⠀⠀⠠⠀⠠
-⠀⠂⠀⠈⢀⠀⠁⢀⠀⠁⠀⠀⡽⡽⣳⡽⣗⣏⠀⠀⠐⠀⠀⠂⠀⠀⠂⢀⠀⠂
-⠄⠀⠁⠠⠀⠀⠄⠀⠀⠄⠁⠙⠊⡯⣾⣺⡵⠋⠃⠁⢀⠈⠀⠠⠈⠀⡀⠀⠀⠄
-⠀⠐⠀⢀⠀⠂⠀⠐⠀⠀⠄⠀⠀⣟⢼⣞⣿⠀⠀⠂⠀⠀⠄⠀⠐⠀⠀⠐⠀⠀
-⠁⠀⠄⠀⢀⠀⠈⢀⠀⠁⠀⠈⢐⡽⣜⣞⣿⡀⠠⠀⠈⢀⠀⠈⢀⠀⠁⢀⠈⠀
-⠐⠀⠀⠐⠀⠀⠐⠀⠀⠄⠈⢀⢮⢯⢞⡾⡽⣧⡀⠀⠂⠀⠀⠐⠀⠀⠄⠀⠀⠂
-⡀⠀⠁⡀⠀⠁⡀⠐⠀⢀⠐⣨⢿⢽⡽⣾⣻⢷⡅⢀⠠⠀⠁⡀⠈⠀⡀⠈⢀⠀
-⠀⠀⠂⠀⠀⠂⠀⠠⠀⣖⡯⣺⢝⣗⢯⢗⡽⣳⢯⣗⡷⠀⠀⠀⠠⠀⠀⠠⠀⠀
-⠈⠀⡀⠈⠀⡀⠂⠀⠀⠺⠽⠽⣝⣞⡽⡽⣝⢷⠯⠷⠛⠀⠈⠀⡀⠀⠂⠀⠐⠀
-⠄⠀⠀⠄⠀⠀⠄⠈⠀⡀⠀⠄⠀⠀⢀⠀⠀⢀⠀⠠⠀⠈⠀⡀⠀⠠⠀⠁⠀⠄
-⢀⠀⠁⠀⠐⠀⠀⠐⠀⠀⠠⠀⠐⠀⠀⠀⠂⠀⠀⠄⠀⠂⠁⠀⠐⠀⠀⠐⠀⠀"""
-        )
-
         art_label = tk.Label(
             self.intro_frame,
-            text=pawn_art,
+            text=_PAWN_ART,
             font=("Courier", 18),
             bg="#111",
             fg="#eee",
             justify=tk.CENTER,
+            takefocus=0,
         )
         art_label.pack(pady=(0, 16))
 
@@ -509,7 +587,7 @@ class ChessGUI:
             self.intro_option_labels.append(label)
 
         self._render_intro_options()
-        self._intro_blink_job = self.root.after(500, self._intro_blink)
+        self._schedule_intro_blink()
 
         self.root.bind("<Up>", self._intro_move_up)
         self.root.bind("<Down>", self._intro_move_down)
@@ -531,11 +609,18 @@ class ChessGUI:
 
     def _intro_blink(self) -> None:
         if self.mode != "intro" or not self.intro_option_labels:
-            self._intro_blink_job = None
+            self._cancel_intro_blink()
             return
         self._intro_blink_state = not self._intro_blink_state
-        self._render_intro_options()
-        self._intro_blink_job = self.root.after(500, self._intro_blink)
+        # Only the selected option's color changes on a blink; the texts stay as rendered.
+        self.intro_option_labels[self._intro_selection].config(
+            fg="#ffd700" if self._intro_blink_state else "#444444"
+        )
+        self._schedule_intro_blink()
+
+    def _schedule_intro_blink(self) -> None:
+        self._next_intro_blink = time.monotonic() + INTRO_BLINK_INTERVAL_MS / 1000
+        self._reschedule_blink_tick()
 
     def _intro_move_up(self, event: tk.Event | None = None):
         if self.mode != "intro":
@@ -572,15 +657,16 @@ class ChessGUI:
     def _teardown_intro_bindings(self) -> None:
         for seq in ("<Up>", "<Down>", "<Return>"):
             self.root.unbind(seq)
-        if self._intro_blink_job is not None:
-            try:
-                self.root.after_cancel(self._intro_blink_job)
-            except tk.TclError:
-                pass
-            self._intro_blink_job = None
+        self._cancel_intro_blink()
         self.intro_option_labels = []
 
+    def _cancel_intro_blink(self) -> None:
+        self._next_intro_blink = None
+        self._reschedule_blink_tick()
+
     def _handle_escape(self, event: tk.Event | None = None):
+        from tkinter import messagebox
+
         if self.mode == "intro":
             if messagebox.askyesno("Exit", "Exit the game?", parent=self.root):
                 self._exit_game()
@@ -623,8 +709,9 @@ class ChessGUI:
         self.entry_row.pack_forget()
         self.help_label.pack_forget()
         self._show_theme_sidebar()
-        self.board = chess.Board()
+        self.board.reset()
         self.move_history.clear()
+        self._invalidate_moves_text()
         self.undo_stack.clear()
         self.redo_stack.clear()
         self.preview_board_theme = None
@@ -649,6 +736,7 @@ class ChessGUI:
         self.preview_board_theme = None
         self.preview_piece_color_theme = None
         self.move_history.clear()
+        self._invalidate_moves_text()
         self.undo_stack.clear()
         self.redo_stack.clear()
         self.mode = "intro"
@@ -681,8 +769,7 @@ class ChessGUI:
     def _update_theme_info_wraplength(self) -> None:
         if self.theme_info_label is None or not self.theme_info_label.winfo_exists():
             return
-        wrap = tkfont.Font(font=MOVE_FONT).measure("M" * LISTBOX_WIDTH)
-        self.theme_info_label.config(wraplength=wrap, width=LISTBOX_WIDTH)
+        self.theme_info_label.config(wraplength=self._theme_info_wrap, width=LISTBOX_WIDTH)
 
     def _show_theme_menu(self) -> None:
         if self.theme_listbox is None:
@@ -793,7 +880,7 @@ class ChessGUI:
         elif self.theme_detail_category == "piece_color":
             if 0 <= index < len(self.piece_color_themes):
                 self.preview_piece_color_theme = self.piece_color_themes[index]
-        self._render()
+        self._mark_board_dirty()
 
     def _on_theme_activate(self, _event: tk.Event | None = None):
         if self.theme_listbox is None:
@@ -830,25 +917,34 @@ class ChessGUI:
     def _start_game_from_intro(self, event: tk.Event | None = None) -> None:
         if self.mode != "intro" or not hasattr(self, "intro_frame"):
             return
-        self._teardown_intro_bindings()
-        self.intro_frame.destroy()
-        del self.intro_frame
-        self._stop_enemy_blink()
-        if not self._timers_visible:
-            self.timers_row.pack(fill=tk.X, pady=(0, 4))
-            self._timers_visible = True
-        self.main_frame.pack(fill=tk.BOTH, expand=True)
-        self.mode = "game_setup"
-        self.move_entry.configure(state=tk.NORMAL)
-        self.status_label.config(text="Enter Enemy Elo\n(1350-2850, default 1500)")
-        self.move_entry.delete(0, tk.END)
-        self.move_entry.insert(0, "1500")
-        self.move_entry.selection_range(0, tk.END)
-        self.move_entry.focus_set()
-        self.move_entry.bind("<Return>", self._on_submit_with_rating)
-        self.undo_stack = [self.board.fen()]
-        self.redo_stack.clear()
-        self._render()
+        with self._batch_updates():
+            self._teardown_intro_bindings()
+            self.intro_frame.destroy()
+            del self.intro_frame
+            self._stop_enemy_blink()
+            if not self._timers_visible:
+                self.timers_row.pack(fill=tk.X, pady=(0, 4))
+                self._timers_visible = True
+            self.main_frame.pack(fill=tk.BOTH, expand=True)
+            self.mode = "game_setup"
+            self.move_entry.configure(state=tk.NORMAL)
+            self.status_label.config(text="Enter Enemy Elo\n(1350-2850, default 1500)")
+            self.move_entry.delete(0, tk.END)
+            self.move_entry.insert(0, "1500")
+            self.move_entry.selection_range(0, tk.END)
+            self.move_entry.focus_set()
+            self.undo_stack = [self.board.fen()]
+            self.redo_stack.clear()
+            self._mark_board_dirty()
+            self._mark_moves_dirty()
+
+    def _dispatch_submit(self, event: tk.Event | None = None) -> None:
+        if self.mode == "game_setup":
+            self._on_submit_with_rating(event)
+        elif self.mode == "time_select":
+            self._on_submit_time_mode(event)
+        else:
+            self._on_submit(event)
 
     def _on_submit_with_rating(self, event: tk.Event | None = None) -> None:
         text = self.move_entry.get().strip()
@@ -861,17 +957,16 @@ class ChessGUI:
             self.status_label.config(text="Rating must be a number (1350-2850).")
             self.move_entry.selection_range(0, tk.END)
             return
-        rating = max(self.engine_config.min_rating, min(rating, self.engine_config.max_rating))
-        self.move_entry.delete(0, tk.END)
-        self.ai.set_rating(rating)
-        self.mode = "time_select"
-        self.status_label.config(text="Select game mode\n (1:Rapid 2:Blitz 3:Practice)")
-        self.enemy_label.config(text="Enemy: Ready", fg=ENEMY_BASE_COLOR)
-        self.move_entry.insert(0, "1")
-        self.move_entry.selection_range(0, tk.END)
-        self.move_entry.focus_set()
-        self.move_entry.bind("<Return>", self._on_submit_time_mode)
-        self._render()
+        with self._batch_updates():
+            rating = max(self.engine_config.min_rating, min(rating, self.engine_config.max_rating))
+            self.move_entry.delete(0, tk.END)
+            self.ai.set_rating(rating)
+            self.mode = "time_select"
+            self.status_label.config(text="Select game mode\n (1:Rapid 2:Blitz 3:Practice)")
+            self.enemy_label.config(text="Enemy: Ready", fg=ENEMY_BASE_COLOR)
+            self.move_entry.insert(0, "1")
+            self.move_entry.selection_range(0, tk.END)
+            self.move_entry.focus_set()
 
     def _on_submit_time_mode(self, event: tk.Event | None = None) -> None:
         choice_text = self.move_entry.get().strip()
@@ -892,8 +987,6 @@ class ChessGUI:
         self._awaiting_ai = False
         self.mode = "game"
         self.status_label.config(text="Enemy rating set. Player to move.")
-        self.move_entry.bind("<Return>", self._on_submit)
-        self._render()
         self._start_timer_tick()
 
     # ===== 게임 진행 =====
@@ -901,6 +994,8 @@ class ChessGUI:
         text = self.move_entry.get().strip()
         if not text:
             return
+        # Apply queued label text first so the direct writes below are not overwritten by it.
+        self._flush_labels()
         lowered = text.lower()
         if self._awaiting_ai and lowered not in {"quit", "ff", "/win", "/lose", "/draw", "help"}:
             self.status_label.config(text="Enemy is thinking... please wait.")
@@ -909,6 +1004,8 @@ class ChessGUI:
         self._handle_player_input(text)
 
     def _handle_player_input(self, user_input: str) -> None:
+        from tkinter import messagebox
+
         lowered = user_input.lower()
         if lowered in {"ff", "help", "quit", "undo", "redo", "hint"}:
             command = lowered
@@ -935,19 +1032,18 @@ class ChessGUI:
         if lowered == "redo":
             self._on_redo()
             return
+        if lowered in {"/win", "/lose", "/draw"}:
+            self._handle_forced_outcome(lowered[1:])
+            return
         if lowered == "quit":
             self._stop_enemy_blink()
-            if self._ai_job is not None:
-                try:
-                    self.root.after_cancel(self._ai_job)
-                except tk.TclError:
-                    pass
-                self._ai_job = None
+            self._cancel_ai_move()
             self._awaiting_ai = False
             self._exit_game()
             return
         if lowered == "ff":
             self._stop_enemy_blink()
+            self._cancel_ai_move()
             self._resigned = True
             self._forfeited = True
             self._awaiting_ai = False
@@ -958,20 +1054,35 @@ class ChessGUI:
                 self._return_to_intro()
             return
 
+        if not _SAN_RE.match(user_input):
+            self.status_label.config(text=f"Illegal move: {user_input}")
+            return
+
         try:
             move = self.board.parse_san(user_input)
-            san = self.board.san(move)
         except ValueError:
             self.status_label.config(text=f"Illegal move: {user_input}")
             return
 
-        self.board.push(move)
+        stem = user_input.rstrip("+#").replace("0", "O")
+        # parse_san is lenient about "x" and pawn file prefixes, so only trust the typed
+        # stem when it agrees with the move itself; anything else goes through board.san.
+        if (
+            _PLAIN_SAN_RE.fullmatch(stem)
+            and ("x" in stem) == self.board.is_capture(move)
+            and (stem[0] not in "abcdefgh" or ord(stem[0]) - 97 == chess.square_file(move.from_square))
+        ):
+            self.board.push(move)
+            san = stem + ("#" if self.board.is_checkmate() else "+" if self.board.is_check() else "")
+        else:
+            san = self.board.san_and_push(move)
         self.move_history.append(san)
         self.undo_stack.append(self.board.fen())
         self.redo_stack.clear()
-        self.status_label.config(text="Enemy is thinking...")
-        self.enemy_label.config(text="Enemy: Calculating...", fg=ENEMY_BASE_COLOR)
-        self._render()
+        self._queue_label(self.status_label, text="Enemy is thinking...")
+        self._queue_label(self.enemy_label, text="Enemy: Calculating...", fg=ENEMY_BASE_COLOR)
+        self._mark_board_dirty()
+        self._mark_moves_dirty()
 
         if self.board.is_game_over(claim_draw=True):
             self._announce_result()
@@ -981,43 +1092,74 @@ class ChessGUI:
         self._schedule_ai_move()
 
     def _play_ai_move(self) -> None:
+        fen = self.board.fen()
+        future = self._executor.submit(self.ai.choose_move, self._board_snapshot(), think_time=0.05)
+        self._ai_future = future
+        self._ai_job = self.root.after(AI_POLL_INTERVAL_MS, self._check_ai_move, future, fen)
+
+    def _check_ai_move(self, future: Future, fen: str) -> None:
+        from tkinter import messagebox
+
+        if future is not self._ai_future:
+            return
+        if not future.done():
+            self._ai_job = self.root.after(AI_POLL_INTERVAL_MS, self._check_ai_move, future, fen)
+            return
+        self._ai_job = None
+        self._ai_future = None
         try:
-            ai_move = self.ai.choose_move(self.board, think_time=0.05)
+            ai_move = future.result()
         except Exception as exc:
             messagebox.showerror("Engine error", str(exc), parent=self.root)
             self._awaiting_ai = False
-            self._ai_job = None
+            return
+        # The game may have been reset or left while the engine was thinking.
+        if self.board.fen() != fen:
+            self._awaiting_ai = False
             return
 
-        self._ai_job = None
-
-        san = self.board.san(ai_move)
-        self.board.push(ai_move)
+        san = self.board.san_and_push(ai_move)
         self.move_history.append(san)
         self.undo_stack.append(self.board.fen())
-        self.enemy_label.config(text=f"Enemy: {san}", fg=ENEMY_BASE_COLOR)
-        self.status_label.config(text="Player to move.")
+        # The blink below sets the label color, so only the text is queued here.
+        self._queue_label(self.enemy_label, text=f"Enemy: {san}")
+        self._queue_label(self.status_label, text="Player to move.")
         self._awaiting_ai = False
+        self._mark_board_dirty()
+        self._mark_moves_dirty()
         self._start_enemy_blink(ai_move.to_square)
 
-        if self.board.is_game_over(claim_draw=True):
+        # Draw claims are left to the player's own moves; the repetition scan behind
+        # claim_draw is the costly part, so the AI side only checks forced endings.
+        if self.board.is_game_over():
             self._announce_result()
 
+    def _board_snapshot(self) -> "chess.Board":
+        # Engine calls only need the current position, so skip copying the move stack.
+        # The snapshot has no history: callers must not board.pop() on it.
+        return self.board.copy(stack=False)
+
     def _schedule_ai_move(self) -> None:
         delay_s = self._estimate_position_difficulty() * self._elo_delay_scale()
         delay_ms = max(50, int(min(4.0, delay_s) * 1000))
+        self._cancel_ai_move()
+        self._ai_job = self.root.after(delay_ms, self._play_ai_move)
+
+    def _cancel_ai_move(self) -> None:
         if self._ai_job is not None:
             try:
                 self.root.after_cancel(self._ai_job)
             except tk.TclError:
                 pass
             self._ai_job = None
-        self._ai_job = self.root.after(delay_ms, self._play_ai_move)
+        if self._ai_future is not None:
+            self._ai_future.cancel()
+            self._ai_future = None
 
     def _estimate_position_difficulty(self) -> float:
         try:
-            import random
-            legal_count = sum(1 for _ in self.board.legal_moves)
+            # Only the buckets below matter, so stop generating moves once past the last threshold.
+            legal_count = sum(1 for _ in islice(self.board.legal_moves, 26))
             base = 0.6 if legal_count <= 10 else (1.2 if legal_count <= 25 else 2.0)
             if self.board.is_check():
                 base += 0.5
@@ -1042,8 +1184,12 @@ class ChessGUI:
             return 1.0
 
     def _handle_forced_outcome(self, outcome: str) -> None:
+        from tkinter import messagebox
+
         self._cancel_timer()
         self._stop_enemy_blink()
+        self._cancel_ai_move()
+        self._flush_labels()
         mapping = {
             "win": ("Player wins!", "Enemy: Defeated"),
             "lose": ("Enemy wins!", "Enemy: Victory"),
@@ -1060,7 +1206,10 @@ class ChessGUI:
             self._return_to_intro()
 
     def _announce_result(self) -> None:
+        from tkinter import messagebox
+
         self._cancel_timer()
+        self._flush_labels()
         outcome = self.board.outcome(claim_draw=True)
         if outcome is None:
             result_text = "Game ended prematurely."
@@ -1085,6 +1234,8 @@ class ChessGUI:
             self._return_to_intro()
 
     def _ask_play_again(self) -> bool:
+        from tkinter import messagebox
+
         again = messagebox.askyesno("Play again?", "Would you like to start a new game?", parent=self.root)
         if again:
             self._reset_game()
@@ -1093,7 +1244,9 @@ class ChessGUI:
 
     def _return_to_intro(self) -> None:
         self._cancel_timer()
+        self._cancel_label_flush()
         self._stop_enemy_blink()
+        self._cancel_ai_move()
         self._clear_hint_highlights()
         if self._timers_visible:
             self.timers_row.pack_forget()
@@ -1102,8 +1255,9 @@ class ChessGUI:
         self.move_entry.configure(state=tk.DISABLED)
         self.status_label.config(text="Welcome, Player!")
         self.enemy_label.config(text="Enemy: Ready", fg=ENEMY_BASE_COLOR)
-        self.board = chess.Board()
+        self.board.reset()
         self.move_history.clear()
+        self._invalidate_moves_text()
         self.undo_stack = [self.board.fen()]
         self.redo_stack.clear()
         self._awaiting_ai = False
@@ -1121,59 +1275,188 @@ class ChessGUI:
         self._show_intro_screen()
 
     def _reset_game(self) -> None:
-        self.board = chess.Board()
-        self.move_history.clear()
-        self.undo_stack = [self.board.fen()]
-        self.redo_stack.clear()
-        self._stop_enemy_blink()
-        self.enemy_label.config(text="Enemy: Ready", fg=ENEMY_BASE_COLOR)
-        self.status_label.config(text="New game! Player to move.")
-        self._resigned = False
-        self._forfeited = False
-        self._awaiting_ai = False
-        self._closing = False
-        self.mode = "game"
-        self._shortcuts_enabled = True
-        self._hint_enabled = True
-        if self._ai_job is not None:
+        self._flush_labels()
+        with self._batch_updates():
+            self.board.reset()
+            self._executor.submit(self.ai.new_game)
+            self._last_render_key = None
+            self._row_strings = []
+            self._row_bitboards = None
+            self._board_text_cache.clear()
+            self._last_board_lines = []
+            self._invalidate_moves_text()
+            self.move_history.clear()
+            self.undo_stack = [self.board.fen()]
+            self.redo_stack.clear()
+            self._stop_enemy_blink()
+            self.enemy_label.config(text="Enemy: Ready", fg=ENEMY_BASE_COLOR)
+            self.status_label.config(text="New game! Player to move.")
+            self._resigned = False
+            self._forfeited = False
+            self._awaiting_ai = False
+            self._closing = False
+            self.mode = "game"
+            self._shortcuts_enabled = True
+            self._hint_enabled = True
+            self._cancel_ai_move()
+            self._mark_board_dirty()
+            self._mark_moves_dirty()
+            if self.time_mode is not None:
+                self._apply_time_mode(self.time_mode)
+                self._start_timer_tick()
+
+    # ===== 화면 갱신 =====
+    def _mark_board_dirty(self) -> None:
+        self._board_dirty = True
+        self._request_render()
+
+    def _mark_moves_dirty(self) -> None:
+        self._moves_dirty = True
+        self._request_render()
+
+    def _request_render(self) -> None:
+        # Coalesce bursts of state changes into one redraw when Tk goes idle.
+        if self._batch_depth:
+            self._render_deferred = True
+            return
+        if self._render_job is None:
+            self._render_job = self.root.after_idle(self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_job = None
+        self._render_dirty()
+
+    @contextmanager
+    def _batch_updates(self) -> Iterator[None]:
+        # Reentrant: renders requested inside the outermost batch run once on exit,
+        # followed by a single layout pass.
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._render_deferred:
+                    self._render_deferred = False
+                    self._render_dirty()
+                self.root.update_idletasks()
+
+    def _cancel_render(self) -> None:
+        if self._render_job is not None:
             try:
-                self.root.after_cancel(self._ai_job)
+                self.root.after_cancel(self._render_job)
             except tk.TclError:
                 pass
-            self._ai_job = None
-        self._render()
-        if self.time_mode is not None:
-            self._apply_time_mode(self.time_mode)
-            self._start_timer_tick()
+            self._render_job = None
+
+    def _queue_label(self, label: tk.Label, **options) -> None:
+        # Label writes from one burst are merged and applied together on the next flush.
+        self._pending_labels.setdefault(label, {}).update(options)
+        if self._label_job is None:
+            self._label_job = self.root.after(LABEL_FLUSH_MS, self._flush_labels)
+
+    def _flush_labels(self) -> None:
+        if self._label_job is not None:
+            try:
+                self.root.after_cancel(self._label_job)
+            except tk.TclError:
+                pass
+            self._label_job = None
+        pending, self._pending_labels = self._pending_labels, {}
+        for label, options in pending.items():
+            label.config(**options)
+
+    def _cancel_label_flush(self) -> None:
+        self._pending_labels = {}
+        if self._label_job is not None:
+            try:
+                self.root.after_cancel(self._label_job)
+            except tk.TclError:
+                pass
+            self._label_job = None
 
-    # ===== 화면 갱신 =====
     def _render(self) -> None:
+        self._board_dirty = True
+        self._moves_dirty = True
+        self._render_dirty()
+
+    def _render_dirty(self) -> None:
         if self._is_rendering:
             return
         self._is_rendering = True
         try:
-            board_text = self._board_to_text(self.board)
-            board_lines = board_text.splitlines() or [""]
-            moves_text = self._moves_to_text(self.move_history)
-
-            max_cols = max(len(line) for line in board_lines)
-            board_line_count = len(board_lines)
-            self.board_text.config(state=tk.NORMAL, width=max_cols, height=board_line_count)
-            self.board_text.delete("1.0", tk.END)
-            self.board_text.insert(tk.END, board_text)
-            self._apply_board_theme_tags(board_lines)
-            self.board_text.config(state=tk.DISABLED)
-
-            if self.mode not in {"theme_menu", "theme_detail"}:
-                self.moves_text.config(state=tk.NORMAL)
-                self.moves_text.delete("1.0", tk.END)
-                self.moves_text.insert(tk.END, moves_text)
-                self.moves_text.config(state=tk.DISABLED)
-
+            if self._board_dirty:
+                self._board_dirty = False
+                self._render_board()
+            if self._moves_dirty:
+                self._moves_dirty = False
+                self._render_moves()
         finally:
             self._is_rendering = False
 
-    def _apply_board_theme_tags(self, board_lines: List[str]) -> None:
+    def _render_board(self) -> None:
+        key = (
+            self.board._transposition_key(),
+            self._enemy_highlight_square,
+            self._effective_board_theme(),
+            self._effective_piece_color_theme(),
+        )
+        if key == self._last_render_key:
+            return
+        board_text = self._board_to_text(self.board)
+        line_count = board_text.count("\n") + 1
+        # _row_strings already holds the lines; copy it since the grid is patched in place.
+        board_lines = self._row_strings[:]
+
+        self.board_text.config(state=tk.NORMAL)
+        self._patch_board_cells(self._last_board_lines, board_lines)
+        self._last_board_lines = board_lines
+        self._apply_board_theme_tags(line_count)
+        self.board_text.config(state=tk.DISABLED)
+        self._last_render_key = key
+
+    def _render_moves(self) -> None:
+        if self.mode in {"theme_menu", "theme_detail"}:
+            return
+        self._sync_moves_text()
+
+    def _patch_board_cells(self, old_lines: List[str], new_lines: List[str]) -> None:
+        # A move touches two to four squares, so rewrite just those cells rather than whole ranks.
+        if len(old_lines) != len(new_lines):
+            self._patch_text_lines(self.board_text, old_lines, new_lines)
+            return
+        for line_no, (old, new) in enumerate(zip(old_lines, new_lines), start=1):
+            if old == new:
+                continue
+            if len(old) != len(new):
+                self.board_text.delete(f"{line_no}.0", f"{line_no}.end")
+                self.board_text.insert(f"{line_no}.0", new)
+                continue
+            for col in range(EDGE_LABEL_WIDTH, len(new), CELL_WIDTH):
+                cell = new[col:col + CELL_WIDTH]
+                if old[col:col + CELL_WIDTH] != cell:
+                    self.board_text.delete(f"{line_no}.{col}", f"{line_no}.{col + len(cell)}")
+                    self.board_text.insert(f"{line_no}.{col}", cell)
+
+    def _patch_text_lines(self, widget: tk.Text, old_lines: List[str], new_lines: List[str]) -> None:
+        # Rewrite only the lines that differ from what the widget currently shows.
+        if not old_lines or not new_lines:
+            widget.delete("1.0", tk.END)
+            widget.insert(tk.END, "\n".join(new_lines))
+            return
+        for line_no, (old, new) in enumerate(zip_longest(old_lines, new_lines), start=1):
+            if old == new:
+                continue
+            if new is None:
+                widget.delete(f"{line_no - 1}.end", tk.END)
+                break
+            if old is None:
+                widget.insert(tk.END, "\n" + new)
+                continue
+            widget.delete(f"{line_no}.0", f"{line_no}.end")
+            widget.insert(f"{line_no}.0", new)
+
+    def _apply_board_theme_tags(self, line_count: int) -> None:
         if chess is None:
             return
         board_theme = self._effective_board_theme()
@@ -1189,27 +1472,20 @@ class ChessGUI:
         for tag in ("square_light", "square_dark", "piece_white", "piece_black", "hint_square", "hint_piece"):
             self.board_text.tag_remove(tag, "1.0", tk.END)
 
-        if len(board_lines) < 9:
-            return
-
-        for rank_offset in range(8):
-            line_number = rank_offset + 2
-            rank_idx = 7 - rank_offset
-            for file_idx in range(8):
-                start_col = EDGE_LABEL_WIDTH + file_idx * CELL_WIDTH
-                end_col = start_col + CELL_WIDTH
-                start_index = f"{line_number}.{start_col}"
-                end_index = f"{line_number}.{end_col}"
-                square_tag = "square_light" if (file_idx + rank_idx) % 2 else "square_dark"
-                square = chess.square(file_idx, rank_idx)
-                piece = self.board.piece_at(square)
-                self.board_text.tag_add(square_tag, start_index, end_index)
-                blink_hidden = (
-                    self._enemy_highlight_square == square and not self._enemy_blink_visible
-                )
-                if piece and not blink_hidden:
-                    piece_tag = "piece_white" if piece.color == chess.WHITE else "piece_black"
-                    self.board_text.tag_add(piece_tag, start_index, end_index)
+        if line_count < BOARD_HEIGHT_LINES:
+            return
+
+        self.board_text.tag_add("square_light", *_SQUARE_TAG_RANGES["square_light"])
+        self.board_text.tag_add("square_dark", *_SQUARE_TAG_RANGES["square_dark"])
+        piece_ranges: dict = {"piece_white": [], "piece_black": []}
+        for square, piece in self.board.piece_map().items():
+            line, col = _SQUARE_CELLS[square]
+            piece_tag = "piece_white" if piece.color == chess.WHITE else "piece_black"
+            piece_ranges[piece_tag].extend((f"{line}.{col}", f"{line}.{col + CELL_WIDTH}"))
+        for piece_tag, ranges in piece_ranges.items():
+            if ranges:
+                self.board_text.tag_add(piece_tag, *ranges)
+        self._apply_enemy_blink_tag()
         # Ensure hint overlays stay on top of theme tags
         try:
             self.board_text.tag_raise("hint_square")
@@ -1234,58 +1510,142 @@ class ChessGUI:
         return self.piece_color_themes[index]
 
     def _board_to_text(self, board: "chess.Board") -> str:
-        header_cells = [chr(ord("a") + file).center(CELL_WIDTH) for file in range(8)]
-        header = " " * EDGE_LABEL_WIDTH + "".join(header_cells)
-        lines = [header]
-        for rank in range(7, -1, -1):
-            square_chunks: List[str] = []
-            for file in range(8):
-                square = chess.square(file, rank)
-                piece = board.piece_at(square)
-                blink_hidden = (
-                    self._enemy_highlight_square == square and not self._enemy_blink_visible
-                )
-                if piece is None or blink_hidden:
-                    chunk = " " * CELL_WIDTH
-                else:
-                    symbol = self._piece_symbol(piece.symbol())
-                    chunk = symbol.center(CELL_WIDTH)
-                square_chunks.append(chunk)
-            row_label = str(rank + 1).rjust(EDGE_LABEL_WIDTH)
-            line = f"{row_label}{''.join(square_chunks)}"
-            lines.append(line)
-        return "\n".join(lines)
-
-    def _piece_symbol(self, symbol: str) -> str:
-        if self.use_unicode:
-            return UNICODE_PIECES.get(symbol, symbol)
-        return ASCII_PIECES.get(symbol, symbol)
+        # The text only depends on piece placement, so repeated positions are served from an LRU cache.
+        bitboards = (
+            board.pawns,
+            board.knights,
+            board.bishops,
+            board.rooks,
+            board.queens,
+            board.kings,
+            board.occupied_co[chess.WHITE],
+        )
+        key = (bitboards, self.use_unicode)
+        cached = self._board_text_cache.get(key)
+        if cached is not None:
+            self._board_text_cache.move_to_end(key)
+            text, lines = cached
+            self._row_strings = list(lines)
+            self._row_bitboards = bitboards
+            return text
+        self._sync_row_strings(board, bitboards)
+        text = "\n".join(self._row_strings)
+        self._board_text_cache[key] = (text, tuple(self._row_strings))
+        if len(self._board_text_cache) > BOARD_TEXT_CACHE_SIZE:
+            self._board_text_cache.popitem(last=False)
+        return text
+
+    def _sync_row_strings(self, board: "chess.Board", bitboards: tuple) -> None:
+        previous = self._row_bitboards
+        if previous is None:
+            self._row_strings = self._build_row_strings(board)
+        elif previous != bitboards:
+            changed = 0
+            for old, new in zip(previous, bitboards):
+                changed |= old ^ new
+            pieces = board.piece_map(mask=changed)
+            for square in chess.scan_forward(changed):
+                self._apply_move_to_grid(square, self._cell_text(pieces.get(square)))
+        self._row_bitboards = bitboards
+
+    def _apply_move_to_grid(self, square: int, new_cell: str) -> None:
+        line_no, col = _SQUARE_CELLS[square]
+        # _row_strings starts with the header, so rank lines sit one index below their Text line.
+        row = line_no - 1
+        line = self._row_strings[row]
+        self._row_strings[row] = line[:col] + new_cell + line[col + CELL_WIDTH:]
+
+    def _build_row_strings(self, board: "chess.Board") -> List[str]:
+        # One C-level translate per rank expands the FEN placement into rendered cells.
+        ranks = board.board_fen().split("/")
+        return [
+            BOARD_HEADER,
+            *[label + rank.translate(self._fen_rank_table) for label, rank in zip(RANK_LABELS_TOP_DOWN, ranks)],
+        ]
 
-    def _moves_to_text(self, moves: List[str]) -> str:
-        if not moves:
+    def _cell_text(self, piece: Optional["chess.Piece"]) -> str:
+        if piece is None:
+            return EMPTY_CELL
+        return self._cell_table[ord(piece.symbol())]
+
+    def _sync_moves_text(self) -> None:
+        # move_history only grows by appending, so new moves are appended to the widget;
+        # anything else (undo, a fresh game) falls back to a full rewrite.
+        moves = self.move_history
+        count = len(moves)
+        rendered = self._moves_rendered
+        if count == rendered:
+            return
+        self.moves_text.config(state=tk.NORMAL)
+        if not rendered or count < rendered:
+            self.moves_text.delete("1.0", tk.END)
+            self.moves_text.insert(tk.END, self._moves_to_text(moves))
+        else:
+            first_pair = rendered - rendered % 2
+            if rendered % 2:
+                self.moves_text.delete("end-1c linestart", tk.END)
+                prefix = ""
+            else:
+                prefix = "\n"
+            lines = self._format_moves(moves)[first_pair // 2:]
+            self.moves_text.insert(tk.END, prefix + "\n".join(lines))
+        self.moves_text.config(state=tk.DISABLED)
+        self._moves_rendered = count
+
+    def _invalidate_moves_text(self) -> None:
+        self._moves_rendered = None
+        self._moves_formatted.clear()
+        self._moves_formatted_count = 0
+
+    def _format_moves(self, moves: Sequence[str]) -> List[str]:
+        # Pair lines are cached; only the pairs from the last formatted move on are rebuilt.
+        count = len(moves)
+        done = self._moves_formatted_count
+        done = count - count % 2 if count < done else done - done % 2
+        del self._moves_formatted[done // 2:]
+        self._moves_formatted.extend(self._format_move_pair(moves, idx) for idx in range(done, count, 2))
+        self._moves_formatted_count = count
+        return self._moves_formatted
+
+    def _moves_to_text(self, moves: Sequence[str]) -> str:
+        lines = self._format_moves(moves)
+        if not lines:
             return "<no moves yet>"
-        lines = []
-        for idx in range(0, len(moves), 2):
-            white = moves[idx]
-            black = moves[idx + 1] if idx + 1 < len(moves) else ""
-            lines.append(f"{idx // 2 + 1:>2}. {white:<8} {black:<8}")
         return "\n".join(lines)
 
+    def _format_move_pair(self, moves: Sequence[str], idx: int) -> str:
+        # Only the white column needs padding; trailing spaces would just be invisible text.
+        if idx + 1 < len(moves):
+            return f"{idx // 2 + 1:>2}. {moves[idx]:<8} {moves[idx + 1]}"
+        return f"{idx // 2 + 1:>2}. {moves[idx]}"
+
     def _on_close(self) -> None:
+        self._cancel_render()
+        self._cancel_label_flush()
         self._stop_enemy_blink()
+        self._cancel_blink_tick()
         self._cancel_timer()
-        self.ai.close()
+        self._cancel_ai_move()
+        self._shutdown_engine()
         self.root.destroy()
 
+    def _shutdown_engine(self) -> None:
+        # Stockfish can take a moment to quit; let the worker wait for it so the window closes at once.
+        try:
+            self._executor.submit(self.ai.close)
+        except RuntimeError:
+            self.ai.close()
+        self._executor.shutdown(wait=False)
+
     def _start_enemy_blink(self, square: int) -> None:
         self._stop_enemy_blink()
         self._enemy_highlight_square = square
         self._enemy_blink_visible = False
         self._enemy_blink_remaining = ENEMY_BLINK_TOGGLES
         self.enemy_label.config(fg=ENEMY_HIGHLIGHT_COLOR)
-        self._render()
-        if self._enemy_blink_remaining > 0:
-            self._enemy_blink_job = self.root.after(ENEMY_BLINK_INTERVAL_MS, self._enemy_blink_step)
+        self._enemy_fg = ENEMY_HIGHLIGHT_COLOR
+        self._apply_enemy_blink_tag()
+        self._schedule_enemy_blink()
 
     def _enemy_blink_step(self) -> None:
         if self._enemy_blink_remaining <= 0:
@@ -1293,50 +1653,103 @@ class ChessGUI:
             return
         self._enemy_blink_visible = not self._enemy_blink_visible
         self._enemy_blink_remaining -= 1
-        self.enemy_label.config(
-            fg=ENEMY_HIGHLIGHT_COLOR if self._enemy_blink_visible else ENEMY_BASE_COLOR
-        )
-        self._render()
-        if self._enemy_blink_remaining > 0:
-            self._enemy_blink_job = self.root.after(
-                ENEMY_BLINK_INTERVAL_MS, self._enemy_blink_step
-            )
-        else:
-            self._enemy_blink_job = self.root.after(
-                ENEMY_BLINK_INTERVAL_MS, self._stop_enemy_blink
-            )
+        self._enemy_fg = ENEMY_HIGHLIGHT_COLOR if self._enemy_blink_visible else ENEMY_BASE_COLOR
+        self.enemy_label.config(fg=self._enemy_fg)
+        self._update_enemy_blink_color()
+        # Once the toggles run out, the next due step stops the blink.
+        self._schedule_enemy_blink()
+
+    def _schedule_enemy_blink(self) -> None:
+        self._next_enemy_blink = time.monotonic() + ENEMY_BLINK_INTERVAL_MS / 1000
+        self._reschedule_blink_tick()
+
+    def _apply_enemy_blink_tag(self) -> None:
+        square = self._enemy_highlight_square
+        if square is None:
+            return
+        line, col_start = _SQUARE_CELLS[square]
+        self.board_text.tag_add("blink", f"{line}.{col_start}", f"{line}.{col_start + CELL_WIDTH}")
+        self.board_text.tag_raise("blink")
+        self._update_enemy_blink_color()
+
+    def _update_enemy_blink_color(self) -> None:
+        square = self._enemy_highlight_square
+        if square is None or self._enemy_blink_visible:
+            if self._enemy_highlight_dirty:
+                # An empty foreground lets the piece color tag underneath show through.
+                self.board_text.tag_configure("blink", foreground="")
+                self._enemy_highlight_dirty = False
+            return
+        board_theme = self._effective_board_theme()
+        is_light = (chess.square_file(square) + chess.square_rank(square)) % 2
+        hidden = board_theme.light_color if is_light else board_theme.dark_color
+        self.board_text.tag_configure("blink", foreground=hidden)
+        self._enemy_highlight_dirty = True
 
     def _stop_enemy_blink(self) -> None:
-        if self._enemy_blink_job is not None:
-            try:
-                self.root.after_cancel(self._enemy_blink_job)
-            except tk.TclError:
-                pass
-            self._enemy_blink_job = None
+        self._next_enemy_blink = None
+        self._reschedule_blink_tick()
         highlight_was_set = self._enemy_highlight_square is not None
         self._enemy_highlight_square = None
         self._enemy_blink_visible = True
         self._enemy_blink_remaining = 0
-        if self.enemy_label.cget("fg") != ENEMY_BASE_COLOR:
+        if self._enemy_fg != ENEMY_BASE_COLOR:
             self.enemy_label.config(fg=ENEMY_BASE_COLOR)
-        if highlight_was_set and not self._is_rendering:
-            self._render()
+            self._enemy_fg = ENEMY_BASE_COLOR
+        if highlight_was_set:
+            self.board_text.tag_remove("blink", "1.0", tk.END)
+        self._update_enemy_blink_color()
+
+    # ===== 점멸 타이머 =====
+    def _reschedule_blink_tick(self) -> None:
+        # The single timer always waits for the earliest pending deadline, and stops when none is left.
+        if self._blink_tick_job is not None:
+            try:
+                self.root.after_cancel(self._blink_tick_job)
+            except tk.TclError:
+                pass
+            self._blink_tick_job = None
+        deadlines = [d for d in (self._next_intro_blink, self._next_enemy_blink) if d is not None]
+        if not deadlines:
+            return
+        delay_ms = max(1, int((min(deadlines) - time.monotonic()) * 1000 + 0.999))
+        self._blink_tick_job = self.root.after(delay_ms, self._blink_tick)
+
+    def _blink_tick(self) -> None:
+        # One shared timer drives both the intro and the enemy-move blink.
+        self._blink_tick_job = None
+        now = time.monotonic()
+        if self._next_intro_blink is not None and now >= self._next_intro_blink:
+            self._next_intro_blink = None
+            self._intro_blink()
+        if self._next_enemy_blink is not None and now >= self._next_enemy_blink:
+            self._next_enemy_blink = None
+            self._enemy_blink_step()
+        self._reschedule_blink_tick()
+
+    def _cancel_blink_tick(self) -> None:
+        self._next_intro_blink = None
+        self._next_enemy_blink = None
+        if self._blink_tick_job is not None:
+            try:
+                self.root.after_cancel(self._blink_tick_job)
+            except tk.TclError:
+                pass
+            self._blink_tick_job = None
 
     def _exit_game(self) -> None:
         if self._closing:
             return
         self._closing = True
+        self._cancel_render()
+        self._cancel_label_flush()
         self._stop_enemy_blink()
+        self._cancel_blink_tick()
         self._cancel_timer()
-        if self._ai_job is not None:
-            try:
-                self.root.after_cancel(self._ai_job)
-            except tk.TclError:
-                pass
-            self._ai_job = None
+        self._cancel_ai_move()
         self._awaiting_ai = False
         try:
-            self.ai.close()
+            self._shutdown_engine()
         except Exception:
             pass
         try:
@@ -1381,6 +1794,8 @@ class ChessGUI:
         self._timer_job = self.root.after(1000, self._timer_tick)
 
     def _timer_tick(self) -> None:
+        from tkinter import messagebox
+
         self._timer_job = None
         if self.mode != "game":
             return
@@ -1390,15 +1805,11 @@ class ChessGUI:
             self.enemy_time_left -= 1
             if self.enemy_time_left <= 0:
                 self.enemy_time_left = 0
+                self._flush_labels()
                 self.enemy_timer_label.config(text=f"Enemy: {self._fmt_time(self.enemy_time_left)}")
                 self.status_label.config(text="Enemy flag fell. Player wins!")
                 messagebox.showinfo("Time over", "Enemy flag fell. Player wins!", parent=self.root)
-                if self._ai_job is not None:
-                    try:
-                        self.root.after_cancel(self._ai_job)
-                    except tk.TclError:
-                        pass
-                    self._ai_job = None
+                self._cancel_ai_move()
                 self._cancel_timer()
                 self._ask_play_again()
                 return
@@ -1406,21 +1817,20 @@ class ChessGUI:
             self.player_time_left -= 1
             if self.player_time_left <= 0:
                 self.player_time_left = 0
+                self._flush_labels()
                 self.player_timer_label.config(text=f"You: {self._fmt_time(self.player_time_left)}")
                 self.status_label.config(text="Player flag fell. Enemy wins!")
                 messagebox.showinfo("Time over", "Player flag fell. Enemy wins!", parent=self.root)
-                if self._ai_job is not None:
-                    try:
-                        self.root.after_cancel(self._ai_job)
-                    except tk.TclError:
-                        pass
-                    self._ai_job = None
+                self._cancel_ai_move()
                 self._cancel_timer()
                 self._ask_play_again()
                 return
 
-        self.player_timer_label.config(text=f"You: {self._fmt_time(self.player_time_left)}")
-        self.enemy_timer_label.config(text=f"Enemy: {self._fmt_time(self.enemy_time_left)}")
+        # Only the side to move has a running clock, so the other label is left untouched.
+        if self._awaiting_ai:
+            self.enemy_timer_label.config(text=f"Enemy: {self._fmt_time(self.enemy_time_left)}")
+        else:
+            self.player_timer_label.config(text=f"You: {self._fmt_time(self.player_time_left)}")
         self._timer_job = self.root.after(1000, self._timer_tick)
 
     def _cancel_timer(self) -> None:
@@ -1471,6 +1881,7 @@ class ChessGUI:
 
     # ===== 이동 되돌리기 =====
     def _on_undo(self) -> None:
+        self._flush_labels()
         if self.mode != "game":
             self.status_label.config(text="Undo is only available during the game.")
             return
@@ -1503,6 +1914,7 @@ class ChessGUI:
         self._render()
 
     def _on_redo(self) -> None:
+        self._flush_labels()
         if self.mode != "game":
             self.status_label.config(text="Redo is only available during the game.")
             return
@@ -1,36 +1,51 @@
 from __future__ import annotations
+import argparse
+import hashlib
+import importlib
+import os
 import platform
+import sys
+
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_FONT_NAME = "menlo-regular.ttf"
+# 번들 폰트 위치 후보 (앞쪽부터 확인)
+_FONT_CANDIDATES = (
+    os.path.join("ascii_chess", "fonts", _FONT_NAME),
+    os.path.join("fonts", _FONT_NAME),
+)
+
+def _font_target_path():
+    return os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts', _FONT_NAME)
+
+def _font_already_installed():
+    return os.path.exists(_font_target_path())
 
 def is_admin():
     """Check if the script is running with administrator privileges (Windows only)"""
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return True  # macOS/Linux에서는 항상 True 반환
     try:
         import ctypes
         return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
+    except (OSError, AttributeError):
         return False
 
-# Windows에서만 관리자 권한 확인 및 요청
-if platform.system() == "Windows" and not is_admin():
-    import sys
-    import ctypes
-    
-    # 현재 스크립트의 절대 경로 가져오기
-    import os
-    script = os.path.abspath(sys.argv[0])
-    
-    print("폰트 설치를 위해 관리자 권한이 필요합니다. 권한을 요청합니다...")
-    ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, f'"{script}"', None, 1)
-    sys.exit(0)
 
-import argparse
-import os
-import platform
-import shutil
-import subprocess
-import sys
-from pathlib import Path
+def _pip_install_in_process(package_name):
+    # 새 인터프리터를 띄우지 않고 pip 실행
+    # pip 내부 API를 불러올 수 없을 때만 None 반환, 그 외에는 pip 종료 코드 반환
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        return None
+    try:
+        status = pip_main(["install", package_name])
+    except Exception as e:
+        print(f"✗ pip 실행 중 오류: {e}")
+        return 1
+    importlib.invalidate_caches()
+    return status
 
 def check_and_install_package(package_name):
     # python-chess의 실제 임포트 이름은 'chess'이므로 처리
@@ -43,9 +58,17 @@ def check_and_install_package(package_name):
         print(f"✓ {package_name} 패키지가 이미 설치되어 있습니다.")
         return True
     except ImportError:
+        # pip 설치가 필요할 때만 subprocess를 불러옴
+        import subprocess
+
         print(f"{package_name} 패키지가 설치되어 있지 않아 설치를 시도합니다...")
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+            status = _pip_install_in_process(package_name)
+            if status is None:
+                subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+            elif status != 0:
+                print(f"✗ {package_name} 패키지 설치 실패: pip 종료 코드 {status}")
+                return False
             print(f"✓ {package_name} 패키지 설치 완료")
             return True
         except subprocess.CalledProcessError as e:
@@ -53,28 +76,27 @@ def check_and_install_package(package_name):
             return False
 
 def install_font():
-    if platform.system() == "Windows":
-        font_name = "menlo-regular.ttf"
+    if _IS_WINDOWS:
+        font_name = _FONT_NAME
+        target_path = _font_target_path()
+        font_dir = os.path.dirname(target_path)
+
+        # 이미 설치된 경우 ctypes/winreg를 불러오지 않고 바로 종료
+        if os.path.exists(target_path):
+            print(f"✓ {font_name} 폰트가 이미 설치되어 있습니다.")
+            return True
+
         # 폰트 경로 확인
-        font_path = os.path.join("ascii_chess", "fonts", font_name)
-        if not os.path.exists(font_path):
-            font_path = os.path.join("fonts", font_name)
-        
-        if not os.path.exists(font_path):
-            print(f"✗ {font_path} 파일을 찾을 수 없습니다.")
+        font_path = next((path for path in _FONT_CANDIDATES if os.path.exists(path)), None)
+        if font_path is None:
+            print(f"✗ {_FONT_CANDIDATES[-1]} 파일을 찾을 수 없습니다.")
             return False
             
         try:
             import ctypes
+            import shutil
             import winreg
             
-            font_dir = os.path.join(os.environ['WINDIR'], 'Fonts')
-            target_path = os.path.join(font_dir, font_name)
-            
-            if os.path.exists(target_path):
-                print(f"✓ {font_name} 폰트가 이미 설치되어 있습니다.")
-                return True
-                
             shutil.copy2(font_path, font_dir)
             
             # 폰트 등록
@@ -101,29 +123,17 @@ def install_font():
             print(f"✗ 폰트 설치 중 오류 발생: {e}")
             return False
     
-    elif platform.system() == "Darwin":  # macOS
+    elif _SYSTEM == "Darwin":  # macOS
         print("✓ macOS는 기본적으로 Menlo 폰트가 설치되어 있습니다.")
         return True
     
     else:
-        print(f"✗ {platform.system()} 시스템은 자동 설치를 지원하지 않습니다.")
+        print(f"✗ {_SYSTEM} 시스템은 자동 설치를 지원하지 않습니다.")
         return False
 
-# 필요한 패키지 설치
-if not check_and_install_package("python-chess"):
-    print("\n필수 패키지 설치에 실패하여 프로그램을 실행할 수 없습니다.")
-    if platform.system() == "Windows":
-        input("계속하려면 엔터 키를 누르세요...")
-    sys.exit(1)
-
-# 폰트 설치 시도 (실패해도 프로그램은 계속 실행)
-print("\n필요한 폰트를 확인 중입니다...")
-install_font()
-
-from ascii_chess.deps import collect_dependency_status
 
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="ASCII Chess GUI vs Stockfish")
     parser.add_argument("--engine-path", default=None, help="Path to Stockfish executable.")
     parser.add_argument("--min-rating", type=int, default=1350, help="Minimum Stockfish Elo.")
@@ -131,16 +141,75 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--think-time", type=float, default=0.5, help="Default think time per AI move.")
     parser.add_argument("--ascii-only", action="store_true", help="Use ASCII pieces instead of Unicode.")
     parser.add_argument("--no-auto-install", action="store_true", help="Skip python-chess auto-installation.")
-    return parser.parse_args(argv)
+    return parser
+
+
+# 프로세스당 한 번만 생성
+_PARSER = _build_parser()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    return _PARSER.parse_args(argv)
+
+
+# ===== 의존성 결과 캐시 =====
+# 같은 프로세스에서 main()이 다시 불릴 때 재사용 (engine_path, no_auto_install) -> DependencyStatus
+_DEPS_CACHE: dict = {}
+# 스톡피시 경로 캐시 파일이 저장되는 위치
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ascii_chess")
+
+
+def _deps_cache_path(engine_path: str | None) -> str:
+    # PATH나 인터프리터가 바뀌면 다른 캐시 파일을 보게 됨
+    key = f"{engine_path}|{os.environ.get('PATH', '')}|{sys.executable}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(_CACHE_DIR, f"stockfish-{digest}.txt")
+
+
+def _load_cached_stockfish_path(path: str):
+    # 캐시 파일에는 경로 한 줄만 텍스트로 저장
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            stockfish_path = handle.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    # 엔진 파일이 옮겨졌거나 삭제되었으면 다시 탐색
+    if not stockfish_path or not os.path.exists(stockfish_path):
+        return None
+    return stockfish_path
+
+
+def _store_cached_stockfish_path(path: str, stockfish_path) -> None:
+    # 찾지 못한 결과는 저장하지 않음: 사용자가 설치한 뒤 다시 확인해야 하므로
+    if stockfish_path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(stockfish_path)
+    except OSError:
+        pass
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
 
-    deps = collect_dependency_status(
-        engine_path=args.engine_path,
-        auto_install=not args.no_auto_install,
-    )
+    deps_key = (args.engine_path, args.no_auto_install)
+    deps = _DEPS_CACHE.get(deps_key)
+    if deps is None:
+        # --help는 parse_args 안에서 종료되므로 여기서 임포트하면 의존성 검사 모듈을 불러오지 않음
+        from ascii_chess.deps import DependencyStatus, ensure_python_chess, locate_stockfish
+
+        # 디스크 캐시에는 스톡피시 경로만 저장하고, python-chess는 매 실행마다 확인함
+        python_chess_ok = ensure_python_chess(auto_install=not args.no_auto_install)
+        cache_path = _deps_cache_path(args.engine_path)
+        stockfish_path = _load_cached_stockfish_path(cache_path)
+        if stockfish_path is None:
+            stockfish_path = locate_stockfish(args.engine_path)
+            _store_cached_stockfish_path(cache_path, stockfish_path)
+        deps = DependencyStatus(python_chess_ok=python_chess_ok, stockfish_path=stockfish_path)
+    if deps.python_chess_ok and deps.stockfish_path is not None:
+        _DEPS_CACHE[deps_key] = deps
 
     if not deps.python_chess_ok:
         print(
@@ -180,4 +249,26 @@ def main(argv: list[str] | None = None) -> int:
 
 
 if __name__ == "__main__":
+    # Windows에서 폰트 설치가 실제로 필요할 때만 관리자 권한 확인 및 요청
+    if _IS_WINDOWS and not _font_already_installed() and not is_admin():
+        import ctypes
+
+        # 현재 스크립트의 절대 경로 가져오기
+        script = os.path.abspath(sys.argv[0])
+
+        print("폰트 설치를 위해 관리자 권한이 필요합니다. 권한을 요청합니다...")
+        ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, f'"{script}"', None, 1)
+        sys.exit(0)
+
+    # 필요한 패키지 설치
+    if not check_and_install_package("python-chess"):
+        print("\n필수 패키지 설치에 실패하여 프로그램을 실행할 수 없습니다.")
+        if _IS_WINDOWS:
+            input("계속하려면 엔터 키를 누르세요...")
+        sys.exit(1)
+
+    # 폰트 설치 시도 (실패해도 프로그램은 계속 실행)
+    print("\n필요한 폰트를 확인 중입니다...")
+    install_font()
+
     raise SystemExit(main())